@@ -2,16 +2,17 @@
 from __future__ import annotations
 
 import re
+import json
 import time
 import random  # SPEED: jittered pacing to stay polite but fast
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
 import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
@@ -35,6 +36,24 @@ WAIT_SEC   = 10            # keep defined, but we’ll use shorter waits after f
 PAGE_PAUSE = 0.2           # SPEED: reduced from 0.8s
 JITTER_MAX = 0.15          # SPEED: adds 0–0.15s jitter to each profile delay
 PAGE_SIZE  = "100"         # SPEED: try to show max rows per page (falls back if not present)
+CHECKPOINT_MAX_AGE = timedelta(hours=24)  # ignore leftovers from older interrupted runs
+PAGE_SIZE_DROPDOWN = "ctl06$ctl05$ctl00$MembersList$members$ctl01$ctl22$filterTopPager$ddlPageSize"
+
+# SPEED: pick the page-size option in one round-trip instead of Select()'s several.
+# Returns true only when the value actually changed (i.e. a postback was triggered).
+_JS_SET_PAGE_SIZE = """
+const s = document.getElementsByName(arguments[0])[0];
+if (!s) return false;
+for (const o of s.options) {
+    if (o.text.trim() === arguments[1]) {
+        if (s.value === o.value) return false;
+        s.value = o.value;
+        s.dispatchEvent(new Event('change', {bubbles: true}));
+        return true;
+    }
+}
+return false;
+"""
 
 def new_driver(headless: bool = False) -> webdriver.Chrome:
     opts = webdriver.ChromeOptions()
@@ -117,12 +136,8 @@ def set_page_size(driver: webdriver.Chrome, wait: WebDriverWait) -> None:
     Try to switch the top pager to PAGE_SIZE rows per page (if control exists).
     """
     try:
-        dropdown = wait.until(EC.presence_of_element_located((
-            By.NAME,
-            "ctl06$ctl05$ctl00$MembersList$members$ctl01$ctl22$filterTopPager$ddlPageSize"
-        )))
-        Select(dropdown).select_by_visible_text(PAGE_SIZE)
-        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "flexible-list-item")))
+        if driver.execute_script(_JS_SET_PAGE_SIZE, PAGE_SIZE_DROPDOWN, PAGE_SIZE):
+            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "flexible-list-item")))
     except (TimeoutException, NoSuchElementException):
         pass
 
@@ -328,6 +343,30 @@ def scrape_profile(driver: webdriver.Chrome, wait: WebDriverWait, url: str, fall
         "death_year":         death_year,
     }
 
+def load_checkpoint(done_path: Path) -> List[Dict[str, str]]:
+    """
+    Load records already scraped by an interrupted run (one JSON record per line).
+    Stale checkpoints are deleted (and unreadable lines skipped) so we never resume from old data.
+    """
+    if not done_path.exists():
+        return []
+    age = datetime.now() - datetime.fromtimestamp(done_path.stat().st_mtime)
+    if age > CHECKPOINT_MAX_AGE:
+        print(f"[{AID}] Discarding stale checkpoint {done_path.name} ({age} old)")
+        # Removed rather than skipped: appending to it would refresh its mtime and revive the old records
+        done_path.unlink(missing_ok=True)
+        return []
+    records: List[Dict[str, str]] = []
+    with done_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # partial last line from a crash
+            if rec.get("profile_url"):
+                records.append(rec)
+    return records
+
 def scrape_nae(all_years: Optional[List[int]] = None, headless: bool = True) -> pd.DataFrame:
     """
     Scrape NAE directory efficiently.
@@ -336,14 +375,23 @@ def scrape_nae(all_years: Optional[List[int]] = None, headless: bool = True) ->
     - Saves timestamped snapshot to snapshots/3008/YYYYMMDD_HHMMSS.csv and optional legacy CSV to `filepath + "3008.csv"`.
     """
     print(f"[{AID}] Starting scrape_nae (headless={headless})")
+
+    snap_dir = Path("snapshots") / AID
+    snap_dir.mkdir(parents=True, exist_ok=True)
+
+    # Resume: records completed by an interrupted run are kept and their URLs skipped
+    done_path = snap_dir / "inflight.jsonl"
+    records: List[Dict[str, str]] = load_checkpoint(done_path)
+    done: Set[str] = {rec["profile_url"] for rec in records}
+    if done:
+        print(f"[{AID}] Resuming from checkpoint: {len(done)} profiles already scraped")
+    errors_count = 0
+
     driver = new_driver(headless=headless)
 
     # SPEED: use a shorter default wait for most interactions
     wait_short = WebDriverWait(driver, 3)
 
-    records: List[Dict[str, str]] = []
-    errors_count = 0
-
     try:
         # Build a unique set of links to avoid scraping duplicates across years.
         unique_links: List[str] = []
@@ -373,27 +421,32 @@ def scrape_nae(all_years: Optional[List[int]] = None, headless: bool = True) ->
             print(f"[{AID}] Finished collecting links for year {yr} ({idx}/{len(years)})")
 
         # After collecting links (either from years or single pass), scrape once per unique URL
+        unique_links = [href for href in unique_links if href not in done]
         total_links = len(unique_links)
         print(f"[{AID}] Starting to scrape {total_links} unique profiles...")
 
-        for i, href in enumerate(unique_links, 1):
-            print(f"[{AID}] Scraping profile {i}/{total_links}: {href}")
-            try:
-                rec = scrape_profile(
-                    driver, wait_short, href, fallback_year=fallback_year_for.get(href)
-                )
-                records.append(rec)
-
-                # SPEED: fast, jittered pacing to remain polite
-                time.sleep(PAGE_PAUSE + random.random() * JITTER_MAX)
-
-                # Progress reporting every 25 profiles
-                if i % 25 == 0:
-                    print(f"[{AID}] Scraped {i}/{total_links} profiles... ({len(records)} successful)")
-            except Exception as e:
-                errors_count += 1
-                print(f"  - Error scraping profile {i}/{total_links} ({href}): {e}")
-                continue
+        # Append only when resuming; otherwise start a fresh checkpoint
+        with done_path.open("a" if done else "w", encoding="utf-8") as checkpoint:
+            for i, href in enumerate(unique_links, 1):
+                print(f"[{AID}] Scraping profile {i}/{total_links}: {href}")
+                try:
+                    rec = scrape_profile(
+                        driver, wait_short, href, fallback_year=fallback_year_for.get(href)
+                    )
+                    records.append(rec)
+                    checkpoint.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                    checkpoint.flush()
+
+                    # SPEED: fast, jittered pacing to remain polite
+                    time.sleep(PAGE_PAUSE + random.random() * JITTER_MAX)
+
+                    # Progress reporting every 25 profiles
+                    if i % 25 == 0:
+                        print(f"[{AID}] Scraped {i}/{total_links} profiles... ({len(records)} successful)")
+                except Exception as e:
+                    errors_count += 1
+                    print(f"  - Error scraping profile {i}/{total_links} ({href}): {e}")
+                    continue
 
         # Final summary
         print(f"[{AID}] Scraping complete: {len(records)} successful, {errors_count} errors")
@@ -409,13 +462,14 @@ def scrape_nae(all_years: Optional[List[int]] = None, headless: bool = True) ->
         df = df.sort_values(["profile_url", "name"]).drop_duplicates(subset=["profile_url"], keep="first")
 
     # Persist: timestamped snapshot
-    snap_dir = Path("snapshots") / AID
-    snap_dir.mkdir(parents=True, exist_ok=True)
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     snap_path = snap_dir / f"{stamp}.csv"
     print(f"[{AID}] Saving snapshot to {snap_path}")
     df.to_csv(snap_path, index=False)
 
+    # Clean completion: the snapshot now holds every record, so the checkpoint is deleted
+    done_path.unlink(missing_ok=True)
+
     # Save to secondary backup location (if configured)
     save_backup_snapshot(snap_path, AID)
 
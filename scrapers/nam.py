@@ -2,18 +2,54 @@
 from __future__ import annotations
 
 import re
+import json
 import time
+import atexit
+import shutil
+import tempfile
+import threading
+import functools
+import concurrent.futures
 from datetime import datetime
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
+import requests
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import (
+    TimeoutException,
+    WebDriverException,
+)
+
+# SPEED: optional vectorized CSV writer (and Parquet copies); falls back to pandas' writer when absent
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    from pyarrow import parquet as pq
+except ImportError:
+    pa = None
+
+# SPEED: optional on-disk HTTP cache for the listing pages; plain session when absent
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# SPEED: optional faster JSON decoder for the batched card payload
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Import backup utility
 try:
@@ -34,13 +70,60 @@ BASE_URL   = (
     "https://nam.edu/membership/members/directory/?jsf=epro-posts:content-feed&tax=health_status:include_all"
 )
 WAIT_SEC   = 8  # Increased for better reliability
-PAGE_PAUSE = 2.0  # Increased for better page loading
+HTTP_WORKERS    = 8   # parallel page fetches on the plain-HTTP path
+REQUEST_TIMEOUT = 30  # seconds
+HTTP_CACHE_PATH = Path("cache") / AID / "http_cache"  # sqlite file (requests-cache adds .sqlite)
+
+# Card field selectors (shared by the HTTP and Selenium paths); lists are fallback order
+SEL_ARTICLE      = "article.elementor-post"
+SEL_DATE         = "span.sd-post-date"
+SEL_INSTITUTIONS = "div.sd-member-institutions"
+SEL_LOCATION     = "div.sd-post-categories--card-pills span.sd-post-category"
+SEL_NEXT         = "div.jet-filters-pagination__item.prev-next.next"
+SEL_LOADING      = ".jet-filters-loading"  # JetSmartFilters marks the listing with this while an AJAX load is in flight
+NAME_SELECTORS = [
+    "div.elementor-heading-title.elementor-size-default",
+    "h3.elementor-heading-title",
+    ".elementor-heading-title",
+    ".sd-member-name",
+]
+HREF_SELECTORS = [
+    "a.elementor-post__thumbnail__link",
+    "h3.elementor-heading-title a",
+    "a.elementor-post__read-more",
+    "header a",
+    "a",  # fallback: any anchor
+]
+CARD_SELECTORS = {
+    "article": SEL_ARTICLE,
+    "date":    SEL_DATE,
+    "inst":    SEL_INSTITUTIONS,
+    "loc":     SEL_LOCATION,
+    "name":    NAME_SELECTORS,
+    "href":    HREF_SELECTORS,
+    "next":    SEL_NEXT,
+}
+DECEASED_CLASS = "health_status-deceased"
+# SPEED: subresources the card text never depends on; blocked in the browser
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.css",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+]
+ARTICLE_LOCATOR = (By.CSS_SELECTOR, SEL_ARTICLE)
+LOADING_LOCATOR = (By.CSS_SELECTOR, SEL_LOADING)
+
+# Precompiled once; these run for every field of every card
+_WS_RE     = re.compile(r"\s+")
+_YEAR_RE   = re.compile(r"\b(?:19|20)\d{2}\b")
+_PREFIX_RE = re.compile(r"^(?:(?:Dr|Mr|Ms|Mrs|Prof)\.?\s+|Professor\s+)+")  # repeatable: "Dr. Prof. X" -> "X"
+_SUFFIX_RE = re.compile(r"(?:\s+(?:Jr\.?|Sr\.?|II|III|IV)|,\s*(?:PhD|MD|DSc))+$")  # repeatable: "X, MD, PhD" -> "X"
 
 # ----------------------------
 # Helpers
 # ----------------------------
-def new_driver() -> webdriver.Chrome:
-    """Create a reasonably stealthy Chrome driver."""
+def new_driver(profile_dir: str) -> webdriver.Chrome:
+    """Create a reasonably stealthy Chrome driver using profile_dir as its user data dir."""
     opts = webdriver.ChromeOptions()
     opts.add_argument("--window-size=1920,1080")
     opts.add_argument("--disable-blink-features=AutomationControlled")
@@ -61,28 +144,117 @@ def new_driver() -> webdriver.Chrome:
     opts.add_argument("--log-level=3")  # Suppress INFO, WARNING, ERROR
     # Run headless:
     opts.add_argument("--headless=new")
-    return webdriver.Chrome(options=opts)
+    # SPEED: return from driver.get() at DOMContentLoaded; the waits below cover the cards
+    opts.page_load_strategy = "eager"
+    # SPEED: one profile per driver so cookies and the HTTP/JS cache carry across page loads;
+    # never a shared fixed path, which a concurrent run would find already in use
+    opts.add_argument(f"--user-data-dir={profile_dir}")
+    # SPEED: never download avatars (also enforced per-URL below)
+    opts.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    driver = webdriver.Chrome(options=opts)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except WebDriverException as e:
+        print(f"[{AID}] Resource blocking unavailable: {e}")
+    return driver
+
+# One browser per process, reused by every Selenium scrape in it
+_driver_singleton: Optional[webdriver.Chrome] = None
+_driver_profile_dir: Optional[str] = None
+_driver_lock = threading.Lock()
+
+def get_driver() -> webdriver.Chrome:
+    """Return the shared Chrome driver, starting it on first use or after the browser died."""
+    global _driver_singleton, _driver_profile_dir
+    if _driver_singleton is not None:
+        try:
+            _driver_singleton.current_url  # Cheap liveness check
+        except WebDriverException:
+            print(f"[{AID}] Browser session lost; starting a new one")
+            close_driver()
+    with _driver_lock:
+        if _driver_singleton is None:
+            profile_dir = tempfile.mkdtemp(prefix="chrome-nam-")
+            try:
+                _driver_singleton = new_driver(profile_dir)
+            except Exception:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+                raise
+            _driver_profile_dir = profile_dir
+        return _driver_singleton
+
+def close_driver() -> None:
+    """Quit the shared driver and remove its profile (registered with atexit; safe to call more than once)."""
+    global _driver_singleton, _driver_profile_dir
+    with _driver_lock:
+        driver, _driver_singleton = _driver_singleton, None
+        profile_dir, _driver_profile_dir = _driver_profile_dir, None
+    if driver is not None:
+        # Ensure driver shutdown never forces a non-zero process exit
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"[{AID}] Warning: driver.quit() raised an exception: {e}")
+    if profile_dir is not None:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+atexit.register(close_driver)
 
 def norm_text(s: str) -> str:
     """Basic normalization: strip, collapse internal whitespace."""
     if s is None:
         return ""
-    s = s.strip()
-    s = re.sub(r"\s+", " ", s)
-    return s
-
-def clean_name(name: str) -> str:
-    """Remove common prefixes/suffixes and normalize whitespace."""
-    name = norm_text(name)
-    prefixes = ["Dr. ", "Dr ", "Mr. ", "Mr ", "Ms. ", "Ms ", "Mrs. ", "Mrs ", "Prof. ", "Professor "]
-    suffixes = [" Jr.", " Jr", " Sr.", " Sr", " II", " III", " IV", ", PhD", ", MD", ", DSc"]
-    for p in prefixes:
-        if name.startswith(p):
-            name = name[len(p):]
-    for s in suffixes:
-        if name.endswith(s):
-            name = name[: -len(s)]
-    return norm_text(name)
+    return _WS_RE.sub(" ", s.strip())
+
+def clean_names(names: pd.Series) -> pd.Series:
+    """Remove common prefixes/suffixes and normalize whitespace, over a whole column at once."""
+    return (
+        names.str.strip()
+        .str.replace(_WS_RE, " ", regex=True)
+        .str.replace(_PREFIX_RE, "", regex=True)
+        .str.replace(_SUFFIX_RE, "", regex=True)
+        .str.strip()
+    )
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write a snapshot CSV with pyarrow when installed (much faster for all-string frames)."""
+    if pa is None:
+        df.to_csv(path, index=False)
+        return
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+
+def write_parquet(df: pd.DataFrame, path: Path) -> None:
+    """Write a zstd-compressed Parquet copy of a snapshot; skipped when pyarrow isn't installed."""
+    if pa is None:
+        return
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), str(path), compression="zstd")
+
+def persist_outputs(df: pd.DataFrame, snap_path: Path, legacy_target: Optional[str]) -> None:
+    """Write the snapshot (plus its backup copy) and, if requested, the legacy flat CSV."""
+    write_csv(df, snap_path)
+    # Compact columnar copy next to the CSV; diffing keeps reading the CSV snapshots
+    write_parquet(df, snap_path.with_suffix(".parquet"))
+
+    # Save to secondary backup location (if configured)
+    save_backup_snapshot(snap_path, AID)
+
+    # Also write your legacy flat CSV if `filepath` is provided by the caller's runtime
+    if legacy_target:
+        try:
+            legacy_root = Path(str(legacy_target))
+            legacy_file = legacy_root if legacy_root.suffix.lower() == ".csv" else legacy_root / f"{AID}.csv"
+            legacy_file.parent.mkdir(parents=True, exist_ok=True)
+            write_csv(df, legacy_file)
+            print(f"[{AID}] Legacy CSV written to {legacy_file}")
+        except Exception as exc:
+            print(f"[{AID}] Legacy CSV export skipped: {exc}")
+
+# SPEED: one background writer so CSV serialization overlaps whatever the caller does next
+_WRITE_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
 def clean_url(url: str) -> str:
     """Remove query parameters and fragments to stabilize the primary key."""
@@ -91,352 +263,363 @@ def clean_url(url: str) -> str:
     # Split on '?' to drop query strings, split on '#' to drop fragments
     return url.split("?")[0].split("#")[0].strip()
 
-def first_href_in(card) -> str:
-    """Best-effort: fetch a member profile URL from various possible anchors."""
-    # Optimized: try most likely selector first with single call
-    try:
-        # Most common case first
-        el = card.find_element(By.CSS_SELECTOR, "a.elementor-post__thumbnail__link")
-        href = el.get_attribute("href") or ""
-        if clean_url(href):
-            return clean_url(href)
-    except NoSuchElementException:
-        pass
-    
-    # Fallback selectors
-    selectors = [
-        "h3.elementor-heading-title a",
-        "a.elementor-post__read-more", 
-        "header a",
-        "a",  # fallback: any anchor
-    ]
+# SPEED: pull every field for every card in one execute_script round-trip instead of
+# ~7 find_element/get_attribute/.text commands per card. Called with CARD_SELECTORS and
+# DECEASED_CLASS; innerText matches WebElement.text semantics. The same payload reports
+# whether there is a usable "next" button (false when missing, hidden or disabled, matching
+# the old element_to_be_clickable check).
+_JS_EXTRACT_CARDS = """
+const [SELS, DECEASED_CLASS] = arguments;
+const text = (el) => (el && el.innerText) || "";
+const firstText = (root, sels) => {
+    for (const sel of sels) {
+        const t = text(root.querySelector(sel));
+        if (t.trim()) return t;
+    }
+    return "";
+};
+const firstHref = (root, sels) => {
+    for (const sel of sels) {
+        const el = root.querySelector(sel);
+        if (el && el.href) return el.href;
+    }
+    return "";
+};
+const next = document.querySelector(SELS.next);
+return JSON.stringify({
+    has_next: !!next && next.getClientRects().length > 0 && !next.classList.contains("disabled"),
+    cards: Array.from(document.querySelectorAll(SELS.article)).map(a => {
+        const inst = a.querySelector(SELS.inst);
+        return {
+            deceased: a.classList.contains(DECEASED_CLASS) ? "Y" : "",
+            year:  text(a.querySelector(SELS.date)),
+            name:  firstText(a, SELS.name),
+            inst_spans: inst ? Array.from(inst.querySelectorAll("span")).map(text) : [],
+            inst_text:  text(inst),
+            loc:   text(a.querySelector(SELS.loc)),
+            href:  firstHref(a, SELS.href),
+        };
+    }),
+});
+"""
+
+# SPEED: click "next" and resolve as soon as the AJAX swap lands, in one round-trip.
+# The old first card detaching plus a new card being attached marks the new page.
+_JS_CLICK_NEXT_AND_WAIT = """
+const [articleSel, nextSel, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const oldFirst = document.querySelector(articleSel);
+const next = document.querySelector(nextSel);
+if (!next) { done(false); return; }
+let timer = null;
+const observer = new MutationObserver(() => {
+    if ((!oldFirst || !oldFirst.isConnected) && document.querySelector(articleSel)) finish(true);
+});
+const finish = (ok) => { observer.disconnect(); clearTimeout(timer); done(ok); };
+observer.observe(document.body, {childList: true, subtree: true});
+timer = setTimeout(() => finish(false), timeoutMs);
+next.click();
+"""
+
+# Lower-cased span texts that are labels rather than institutions (frozensets: O(1) membership)
+MEMBER_TYPE_LABELS = frozenset({"emeritus", "international", "foreign associate"})
+AFFILIATION_SKIP   = MEMBER_TYPE_LABELS | {"no affiliation", ""}
+
+# Per-card fields, in snapshot column order; the constant id/govid/govname/award
+# columns are broadcast onto the DataFrame once instead of stored in every row
+RECORD_COLUMNS = ["name", "profile_url", "year", "affiliation", "member_type", "location", "deceased"]
+CardRow = Tuple[str, str, str, str, str, str, str]
+
+def new_session(force_refresh: bool = False) -> requests.Session:
+    """
+    HTTP session with browser-like headers and retry/backoff on transient errors.
+    Responses are cached on disk when requests-cache is installed, but every request is revalidated
+    with the server (unchanged pages come back as cheap 304s), so a snapshot never replays stale
+    pages. force_refresh clears that cache first.
+    """
+    if requests_cache is None:
+        session = requests.Session()
+    else:
+        HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            str(HTTP_CACHE_PATH),
+            backend="sqlite",
+            expire_after=requests_cache.EXPIRE_IMMEDIATELY,
+            always_revalidate=True,
+        )
+        if force_refresh:
+            session.cache.clear()
+    session.headers["User-Agent"] = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0.0.0 Safari/537.36"
+    )
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=HTTP_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+@functools.lru_cache(maxsize=None)
+def compile_sel(sel: str) -> CSSSelector:
+    """Translate a CSS selector to lxml's XPath form once instead of on every call."""
+    return CSSSelector(sel)
+
+def _first_text(root, selectors: List[str]) -> str:
     for sel in selectors:
-        try:
-            el = card.find_element(By.CSS_SELECTOR, sel)
-            href = el.get_attribute("href") or ""
-            href = clean_url(href)
-            if href:
-                return href
-        except NoSuchElementException:
-            continue
+        found = compile_sel(sel)(root)
+        if found and found[0].text_content().strip():
+            return found[0].text_content()
     return ""
 
+def _first_href(root, selectors: List[str]) -> str:
+    for sel in selectors:
+        found = compile_sel(sel)(root)
+        if found and found[0].get("href"):
+            return found[0].get("href")
+    return ""
+
+def card_from_html(article) -> Dict:
+    """lxml counterpart of _JS_EXTRACT_CARDS: the same raw fields for one <article>."""
+    inst = compile_sel(SEL_INSTITUTIONS)(article)
+    date = compile_sel(SEL_DATE)(article)
+    loc = compile_sel(SEL_LOCATION)(article)
+    return {
+        "deceased":   "Y" if DECEASED_CLASS in (article.get("class") or "").split() else "",
+        "year":       date[0].text_content() if date else "",
+        "name":       _first_text(article, NAME_SELECTORS),
+        "inst_spans": [span.text_content() for span in compile_sel("span")(inst[0])] if inst else [],
+        "inst_text":  "\n".join(inst[0].itertext()) if inst else "",
+        "loc":        loc[0].text_content() if loc else "",
+        "href":       _first_href(article, HREF_SELECTORS),
+    }
+
+def parse_listing_html(html: str) -> Tuple[List[Dict], Optional[int]]:
+    """
+    Return (raw cards, total page count) from one server-rendered directory page.
+    The page count is None when the page has no pagination markup.
+    """
+    tree = lxml.html.fromstring(html)
+    tree.make_links_absolute(BASE_URL)
+    cards = [card_from_html(a) for a in compile_sel(SEL_ARTICLE)(tree)]
+    page_values = tree.xpath("//div[contains(@class,'jet-filters-pagination__item')]/@data-value")
+    total_pages = max((int(v) for v in page_values if v.isdigit()), default=None)
+    return cards, total_pages
+
+def fetch_listing_page(session: requests.Session, paged: int) -> str:
+    params = {"pagenum": paged} if paged > 1 else None
+    resp = session.get(BASE_URL, params=params, timeout=REQUEST_TIMEOUT)
+    resp.raise_for_status()
+    return resp.text
+
+def card_record(raw: Dict, fallback_id: str) -> CardRow:
+    """Build a normalized RECORD_COLUMNS row from one card's raw fields (as returned by _JS_EXTRACT_CARDS)."""
+    # Year (extract a 4-digit year if present)
+    year = ""
+    m = _YEAR_RE.search(raw.get("year") or "")
+    if m:
+        year = m.group(0)
+
+    name = (raw.get("name") or "").strip()  # cleaned column-wise by clean_names()
+    profile_url = clean_url(raw.get("href") or "")
+
+    # Member Type (e.g., "Emeritus") and Affiliation (actual institution, skipping labels)
+    spans = [(t or "").strip() for t in raw.get("inst_spans") or []]
+    member_type = next((t for t in spans if t.lower() in MEMBER_TYPE_LABELS), "")
+    aff = next((t for t in spans if t.lower() not in AFFILIATION_SKIP), "")
+    if not aff:
+        # Fallback: split the container text by lines and drop labels
+        lines = [line.strip() for line in (raw.get("inst_text") or "").split("\n") if line.strip()]
+        aff = next((line for line in lines if line.lower() not in AFFILIATION_SKIP), "")
+
+    # Create record - NEVER skip, even if name or URL is missing
+    return (
+        name or f"missing_name_{fallback_id}",
+        profile_url or f"missing_url_{fallback_id}",
+        year,  # already a bare 4-digit match
+        norm_text(aff),
+        norm_text(member_type),
+        norm_text(raw.get("loc") or ""),
+        raw.get("deceased") or "",  # literal "Y" or ""
+    )
+
 # ----------------------------
 # Core scraper
 # ----------------------------
-def scrape_nam() -> pd.DataFrame:
+def fetch_pages_http(force_refresh: bool = False) -> Optional[List[List[Dict]]]:
     """
-    Scrape NAM directory into a normalized DataFrame with a stable primary key (profile_url).
-    Saves a timestamped snapshot under snapshots/1909/, and (optionally) the flat CSV to filepath+1909.csv.
+    SPEED: fetch the server-rendered directory pages over plain HTTP (no browser) and
+    parse them with lxml, fetching pages 2..N in parallel.
+    Returns None when this path can't be trusted, so the caller falls back to Selenium.
     """
-    driver = new_driver()
+    session = new_session(force_refresh)
+    try:
+        first, total_pages = parse_listing_html(fetch_listing_page(session, 1))
+        if not first:
+            print(f"[{AID}] HTTP: no server-rendered cards on page 1; falling back to Selenium")
+            return None
+        if total_pages is None:
+            # Without pagination markup page 1 can't be told apart from the whole directory,
+            # and a one-page snapshot would diff as everyone else removed
+            print(f"[{AID}] HTTP: no pagination markup on page 1; falling back to Selenium")
+            return None
+        print(f"[{AID}] HTTP: page 1 has {len(first)} cards, {total_pages} pages total")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=HTTP_WORKERS) as pool:
+            rest = list(pool.map(
+                lambda p: parse_listing_html(fetch_listing_page(session, p))[0],
+                range(2, total_pages + 1),
+            ))
+    except (requests.RequestException, etree.ParserError) as e:
+        print(f"[{AID}] HTTP: fetch failed ({e}); falling back to Selenium")
+        return None
+    finally:
+        session.close()
+
+    # If the server ignores the page parameter every page comes back as page 1
+    if rest and rest[0] and rest[0][0].get("href") == first[0].get("href"):
+        print(f"[{AID}] HTTP: pagination parameter not honored; falling back to Selenium")
+        return None
+    return [first] + rest
+
+def scrape_pages_selenium() -> List[List[Dict]]:
+    """Drive the directory in headless Chrome, clicking through pagination. Returns raw cards per page."""
+    driver = get_driver()
+    # One wait object for the whole run; polls twice as often as the 0.5 s default
+    wait = WebDriverWait(driver, WAIT_SEC, poll_frequency=0.25)
     driver.get(BASE_URL)
-    time.sleep(6)  # Increased initial wait
 
-    db: List[Dict[str, str]] = []
+    pages: List[List[Dict]] = []
     page_num = 1
-    total_cards_attempted = 0
-    total_records_extracted = 0
 
-    print(f"[{AID}] Starting NAM scraper...")
+    while True:
+        print(f"[{AID}] Scraping page {page_num}...")
 
-    try:
-        while True:
-            print(f"[{AID}] Scraping page {page_num}...")
-
-            # Wait longer and more reliably for page content
-            page_loaded = False
-            for load_attempt in range(10):  # Try 10 times to ensure page is loaded
-                try:
-                    WebDriverWait(driver, WAIT_SEC).until(
-                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, "article.elementor-post"))
-                    )
-                    # Additional wait for dynamic content
-                    time.sleep(1.5)
-                    cards = driver.find_elements(By.CSS_SELECTOR, "article.elementor-post")
-                    if len(cards) > 0:
-                        page_loaded = True
-                        break
-                    else:
-                        print(f"[{AID}] Page {page_num}: No cards found (attempt {load_attempt + 1}), retrying...")
-                        time.sleep(2)
-                except TimeoutException:
-                    print(f"[{AID}] Page {page_num}: Timeout waiting for cards (attempt {load_attempt + 1}), retrying...")
-                    time.sleep(2)
-            
-            if not page_loaded:
-                print(f"[{AID}] Page {page_num}: Failed to load after multiple attempts, stopping...")
-                break
-
-            initial_card_count = len(driver.find_elements(By.CSS_SELECTOR, "article.elementor-post"))
-            print(f"[{AID}] Page {page_num}: found {initial_card_count} cards on page")
-            total_cards_attempted += initial_card_count
-
-            page_records = 0
-
-            for i in range(initial_card_count):
-                card_processed = False
-                card_attempts = 0
-                
-                while not card_processed and card_attempts < 50:  # Never give up until 50 attempts
-                    try:
-                        card_attempts += 1
-                        
-                        # Re-fetch cards before each access to avoid stale references
-                        cards = driver.find_elements(By.CSS_SELECTOR, "article.elementor-post")
-                        if i >= len(cards):
-                            # Wait for page to stabilize
-                            time.sleep(2.0)
-                            cards = driver.find_elements(By.CSS_SELECTOR, "article.elementor-post")
-                            if i >= len(cards):
-                                print(f"[{AID}] Page {page_num}, Card {i+1}: Card disappeared, waiting longer...")
-                                time.sleep(3.0)
-                                continue
-                        
-                        card = cards[i]
-
-                        # Pre-get card class for deceased check (single call)
-                        card_class = card.get_attribute("class") or ""
-                        deceased = "Y" if "health_status-deceased" in card_class else ""
-
-                        # Year (extract a 4-digit year if present)
-                        year = ""
-                        try:
-                            year_text = card.find_element(By.CSS_SELECTOR, "span.sd-post-date").text
-                            if year_text:
-                                m = re.search(r"\b(19|20)\d{2}\b", year_text)
-                                if m:
-                                    year = m.group(0)
-                        except NoSuchElementException:
-                            pass
-
-                        # Name - try multiple selectors
-                        name_raw = ""
-                        name_selectors = [
-                            "div.elementor-heading-title.elementor-size-default",
-                            "h3.elementor-heading-title",
-                            ".elementor-heading-title",
-                            ".sd-member-name",
-                        ]
-                        for name_sel in name_selectors:
-                            try:
-                                name_el = card.find_element(By.CSS_SELECTOR, name_sel)
-                                name_raw = name_el.text or ""
-                                if name_raw.strip():
-                                    break
-                            except NoSuchElementException:
-                                continue
-
-                        name = clean_name(name_raw)
-
-                        # Profile URL (primary key)
-                        profile_url = first_href_in(card)
-
-                        # Member Type (check for "Emeritus" or other types)
-                        member_type = ""
-                        try:
-                            # Look for member type labels (e.g., "Emeritus")
-                            type_elements = card.find_elements(By.CSS_SELECTOR, "div.sd-member-institutions span")
-                            for elem in type_elements:
-                                text = (elem.text or "").strip()
-                                if text.lower() in ["emeritus", "international", "foreign associate"]:
-                                    member_type = text
-                                    break
-                        except Exception:
-                            pass
-
-                        # Affiliation - get actual institution, skip member type labels
-                        aff = ""
-                        try:
-                            # Get all text content within the institutions div
-                            aff_container = card.find_element(By.CSS_SELECTOR, "div.sd-member-institutions")
-                            # Get all span elements
-                            aff_spans = aff_container.find_elements(By.CSS_SELECTOR, "span")
-                            
-                            for span in aff_spans:
-                                text = (span.text or "").strip()
-                                # Skip empty, skip member type labels, and skip "No Affiliation"
-                                if text and text.lower() not in ["emeritus", "international", "foreign associate", "no affiliation", ""]:
-                                    aff = text
-                                    break
-                            
-                            # Fallback: if no valid affiliation found in spans, try getting all text
-                            if not aff:
-                                full_text = (aff_container.text or "").strip()
-                                # Split by newlines and filter out member types and "No Affiliation"
-                                lines = [line.strip() for line in full_text.split("\n") if line.strip()]
-                                for line in lines:
-                                    if line.lower() not in ["emeritus", "international", "foreign associate", "no affiliation"]:
-                                        aff = line
-                                        break
-                        except NoSuchElementException:
-                            pass
-
-                        # Location (first category pill if present)
-                        location = ""
-                        try:
-                            loc_el = card.find_element(By.CSS_SELECTOR, "div.sd-post-categories--card-pills span.sd-post-category")
-                            location = loc_el.text or ""
-                        except NoSuchElementException:
-                            pass
-
-                        # Create record - NEVER skip, even if name or URL is missing
-                        # Use card index as fallback identifier if needed
-                        fallback_id = f"page_{page_num}_card_{i+1}"
-                        
-                        record = {
-                            "id":             AID,
-                            "govid":          GOVID,
-                            "govname":        GOVNAME,
-                            "award":          AWARD,
-                            "name":           name or f"missing_name_{fallback_id}",
-                            "profile_url":    norm_text(profile_url) or f"missing_url_{fallback_id}",
-                            "year":           norm_text(year),
-                            "affiliation":    norm_text(aff),
-                            "member_type":    norm_text(member_type),
-                            "location":       norm_text(location),
-                            "member_type":    norm_text(member_type),
-                            "deceased":       norm_text(deceased),
-                        }
-                        
-                        db.append(record)
-                        page_records += 1
-                        total_records_extracted += 1
-                        card_processed = True
-
-                        # Log unusual cases for debugging
-                        if not name.strip() or not profile_url.strip():
-                            print(f"[{AID}] Page {page_num}, Card {i+1}: Captured incomplete record - name: '{name[:30]}', url: '{profile_url[:50]}'")
-
-                    except StaleElementReferenceException:
-                        print(f"[{AID}] Page {page_num}, Card {i+1}: StaleElementReferenceException (attempt {card_attempts}), retrying...")
-                        time.sleep(min(0.5 * (card_attempts // 5 + 1), 3.0))
-                    except Exception as e:
-                        print(f"[{AID}] Page {page_num}, Card {i+1}: Error processing (attempt {card_attempts}) - {e}")
-                        time.sleep(min(0.5 * (card_attempts // 5 + 1), 3.0))
-
-                if not card_processed:
-                    # Last resort: create a placeholder record so we don't lose the count
-                    print(f"[{AID}] Page {page_num}, Card {i+1}: FAILED after {card_attempts} attempts, creating placeholder record")
-                    fallback_id = f"page_{page_num}_card_{i+1}_failed"
-                    db.append({
-                        "id":             AID,
-                        "govid":          GOVID,
-                        "govname":        GOVNAME,
-                        "award":          AWARD,
-                        "profile_url":    f"failed_to_extract_{fallback_id}",
-                        "year":           "",
-                        "name":           f"failed_extraction_{fallback_id}",
-                        "affiliation":    "",
-                        "location":       "",
-                        "deceased":       "",
-                    })
-                    total_records_extracted += 1
-
-            print(f"[{AID}] Page {page_num}: processed {initial_card_count} cards, extracted {page_records} records (running total: {total_records_extracted})")
-
-            # Pagination: more robust navigation detection
+        # Wait longer and more reliably for page content
+        page_loaded = False
+        for load_attempt in range(10):  # Try 10 times to ensure page is loaded
             try:
-                # Wait for pagination to be ready
-                time.sleep(1.0)
-                
-                next_btn = None
-                for nav_attempt in range(5):
-                    try:
-                        next_btn = WebDriverWait(driver, WAIT_SEC).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, "div.jet-filters-pagination__item.prev-next.next"))
-                        )
-                        break
-                    except (StaleElementReferenceException, TimeoutException):
-                        print(f"[{AID}] Page {page_num}: Navigation retry {nav_attempt + 1}")
-                        time.sleep(1.0)
-                
-                if not next_btn or "disabled" in (next_btn.get_attribute("class") or ""):
-                    print(f"[{AID}] Page {page_num}: No next button or disabled, scraping complete.")
+                wait.until(
+                    EC.presence_of_all_elements_located(ARTICLE_LOCATOR)
+                )
+                # SPEED: wait on the filter loader rather than a fixed pause for dynamic content
+                wait.until(EC.invisibility_of_element_located(LOADING_LOCATOR))
+                cards = driver.find_elements(*ARTICLE_LOCATOR)
+                if len(cards) > 0:
+                    page_loaded = True
                     break
-                
-                # Store state before navigation
-                current_url = driver.current_url
-                current_article_count = len(driver.find_elements(By.CSS_SELECTOR, "article.elementor-post"))
-                
-                print(f"[{AID}] Navigating to page {page_num + 1}...")
-                next_btn.click()
-                
-                # Wait for navigation with multiple indicators
-                navigation_success = False
-                for wait_attempt in range(40):  # Wait up to 8 seconds
-                    time.sleep(0.2)
-                    try:
-                        new_url = driver.current_url
-                        new_article_count = len(driver.find_elements(By.CSS_SELECTOR, "article.elementor-post"))
-                        
-                        # Check for successful navigation
-                        if (new_url != current_url or 
-                            new_article_count != current_article_count or
-                            new_article_count >= 10):  # Reasonable article count
-                            
-                            # Confirm articles are actually loaded
-                            WebDriverWait(driver, 3).until(
-                                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "article.elementor-post"))
-                            )
-                            navigation_success = True
-                            break
-                    except Exception:
-                        continue
-                
-                if not navigation_success:
-                    print(f"[{AID}] Page {page_num}: Navigation might have failed, but continuing...")
-                
-                time.sleep(PAGE_PAUSE)
-                page_num += 1
-
-            except (NoSuchElementException, TimeoutException):
-                print(f"[{AID}] No more pages found. Scraping complete.")
+                else:
+                    print(f"[{AID}] Page {page_num}: No cards found (attempt {load_attempt + 1}), retrying...")
+                    time.sleep(2)
+            except TimeoutException:
+                print(f"[{AID}] Page {page_num}: Timeout waiting for cards (attempt {load_attempt + 1}), retrying...")
+                time.sleep(2)
+
+        if not page_loaded:
+            print(f"[{AID}] Page {page_num}: Failed to load after multiple attempts, stopping...")
+            break
+
+        # One round-trip for the whole page. No element handles cross the wire, so
+        # stale references can't occur; only retry on script/JSON failures.
+        raw_cards: List[Dict] = []
+        has_next = False
+        for extract_attempt in range(3):
+            try:
+                payload = json_loads(driver.execute_script(_JS_EXTRACT_CARDS, CARD_SELECTORS, DECEASED_CLASS))
+                raw_cards, has_next = payload["cards"], payload["has_next"]
                 break
-                
-    finally:
-        # Ensure driver shutdown never forces a non-zero process exit
+            except (WebDriverException, ValueError) as e:
+                print(f"[{AID}] Page {page_num}: card extraction failed (attempt {extract_attempt + 1}) - {e}")
+                time.sleep(1.0)
+
+        print(f"[{AID}] Page {page_num}: found {len(raw_cards)} cards on page")
+        pages.append(raw_cards)
+
+        # Pagination: the extraction payload already says whether "next" is usable
+        if not has_next:
+            print(f"[{AID}] Page {page_num}: No next button or disabled, scraping complete.")
+            break
+
+        print(f"[{AID}] Navigating to page {page_num + 1}...")
         try:
-            driver.quit()
-        except Exception as e:
-            print(f"[{AID}] Warning: driver.quit() raised an exception: {e}")
+            swapped = driver.execute_async_script(
+                _JS_CLICK_NEXT_AND_WAIT, SEL_ARTICLE, SEL_NEXT, WAIT_SEC * 1000
+            )
+        except WebDriverException:  # includes the script timeout
+            swapped = False
+        if not swapped:
+            # Re-extracting the same page would loop forever; end the crawl here
+            print(f"[{AID}] Page {page_num}: Navigation to the next page failed, stopping...")
+            break
+
+        page_num += 1
 
-    # Build DataFrame (all as string), normalize NaNs to ""
-    df = pd.DataFrame(db, dtype=str).fillna("")
+    return pages
+
+def scrape_nam(force_refresh: bool = False) -> pd.DataFrame:
+    """
+    Scrape NAM directory into a normalized DataFrame with a stable primary key (profile_url).
+    Saves a timestamped snapshot under snapshots/1909/, and (optionally) the flat CSV to filepath+1909.csv.
+    """
+    print(f"[{AID}] Starting NAM scraper...")
+
+    pages = fetch_pages_http(force_refresh)
+    if pages is None:
+        try:
+            pages = scrape_pages_selenium()
+        except WebDriverException:
+            close_driver()  # Don't hand a dead session to the next scrape in this process
+            raise
+
+    # SPEED: dedupe while collecting (first card wins) instead of sorting the frame afterwards.
+    # Incomplete records carry a per-card placeholder URL, so they never collide.
+    db: Dict[str, CardRow] = {}
+    total_cards_attempted = 0
+    total_records_extracted = 0
+    duplicates_removed = 0
+
+    for page_num, raw_cards in enumerate(pages, 1):
+        total_cards_attempted += len(raw_cards)
+        page_records = 0
+        for i, raw in enumerate(raw_cards):
+            # Use card index as fallback identifier if needed
+            record = card_record(raw, f"page_{page_num}_card_{i+1}")
+            page_records += 1
+            total_records_extracted += 1
+
+            name, profile_url = record[0], record[1]
+            if profile_url in db:
+                duplicates_removed += 1
+            else:
+                db[profile_url] = record
+
+            # Log unusual cases for debugging
+            if name.startswith("missing_name_") or profile_url.startswith("missing_url_"):
+                print(f"[{AID}] Page {page_num}, Card {i+1}: Captured incomplete record - name: '{name[:30]}', url: '{profile_url[:50]}'")
+
+        print(f"[{AID}] Page {page_num}: processed {len(raw_cards)} cards, extracted {page_records} records (running total: {total_records_extracted})")
+    page_num = len(pages)
+
+    # Build DataFrame from row tuples, then broadcast the constant columns up front
+    df = pd.DataFrame(list(db.values()), columns=RECORD_COLUMNS)
+    for pos, (col, value) in enumerate([("id", AID), ("govid", GOVID), ("govname", GOVNAME), ("award", AWARD)]):
+        df.insert(pos, col, value)
+    df["name"] = clean_names(df["name"])
     print(f"Total cards attempted across all pages: {total_cards_attempted}")
     print(f"Total records extracted: {total_records_extracted}")
-    print(f"Raw rows collected: {len(df)}")
-    
-    # Check for any records that might be actual duplicates (not from retries)
+
     if not df.empty:
-        print(f"Unique profile_url count before deduplication: {df['profile_url'].nunique()}")
-        
         # Show sample of any potential issues
-        failed_extractions = df[df['profile_url'].str.contains('failed_to_extract|missing_url', na=False)]
+        failed_extractions = df[df['profile_url'].str.startswith('missing_url_')]
         if len(failed_extractions) > 0:
             print(f"Found {len(failed_extractions)} records with extraction issues:")
             print(failed_extractions[['profile_url', 'name']].head())
-        
-        # Deduplicate more carefully - only remove true duplicates, not failed extractions
-        initial_count = len(df)
-        # Don't deduplicate failed extractions since they might be legitimate separate records
-        mask_failed = df['profile_url'].str.contains('failed_to_extract|missing_url', na=False)
-        df_good = df[~mask_failed]
-        df_failed = df[mask_failed]
-        
-        if not df_good.empty:
-            df_good = df_good.sort_values(["profile_url", "name"]).drop_duplicates(subset=["profile_url"], keep="first")
-        
-        # Recombine
-        df = pd.concat([df_good, df_failed], ignore_index=True) if not df_failed.empty else df_good
-        
-        final_count = len(df)
-        duplicates_removed = initial_count - final_count
-        print(f"Final unique records after deduplication: {final_count}")
+
+        print(f"Final unique records after deduplication: {len(df)}")
         if duplicates_removed > 0:
             print(f"Removed {duplicates_removed} duplicate entries")
-        
-        print(f"✓ SUCCESS: Captured all available records ({final_count} unique records)")
+
+        print(f"✓ SUCCESS: Captured all available records ({len(df)} unique records)")
 
     # ----------------------------
     # Persist: timestamped snapshot + optional flat CSV
@@ -445,34 +628,28 @@ def scrape_nam() -> pd.DataFrame:
     snap_dir.mkdir(parents=True, exist_ok=True)
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     snap_path = snap_dir / f"{stamp}.csv"
-    df.to_csv(snap_path, index=False)
-
-    # Save to secondary backup location (if configured)
-    save_backup_snapshot(snap_path, AID)
-
-    # Also write your legacy flat CSV if `filepath` is provided by the caller's runtime
-    legacy_target = globals().get("filepath")
-    if legacy_target:
-        try:
-            legacy_root = Path(str(legacy_target))
-            legacy_file = legacy_root if legacy_root.suffix.lower() == ".csv" else legacy_root / f"{AID}.csv"
-            legacy_file.parent.mkdir(parents=True, exist_ok=True)
-            df.to_csv(legacy_file, index=False)
-            print(f"[{AID}] Legacy CSV written to {legacy_file}")
-        except Exception as exc:
-            print(f"[{AID}] Legacy CSV export skipped: {exc}")
+    # Callers that need the files on disk wait on scrape_nam.last_write_future. The writer gets
+    # its own copy so a caller mutating the returned frame can't corrupt the snapshot mid-write.
+    scrape_nam.last_write_future = _WRITE_POOL.submit(
+        persist_outputs, df.copy(), snap_path, globals().get("filepath")
+    )
     if not df.empty:
         now = datetime.now().strftime("%H:%M:%S")
-        print(f"[{AID}] AwardID {AID} — scraped ({len(df)} rows) from {page_num} pages and saved snapshot {snap_path.name} at {now}")
+        print(f"[{AID}] AwardID {AID} — scraped ({len(df)} rows) from {page_num} pages; writing snapshot {snap_path.name} at {now}")
     else:
-        print(f"[{AID}] AwardID {AID} — no rows scraped; snapshot still written: {snap_path.name}")
+        print(f"[{AID}] AwardID {AID} — no rows scraped; snapshot still being written: {snap_path.name}")
 
     return df
 
+scrape_nam.last_write_future = None
+
 # Allow: python -m scrapers.nam
 if __name__ == "__main__":
     try:
-        scrape_nam()
+        # --force-refresh: ignore (and clear) the on-disk HTTP cache
+        scrape_nam(force_refresh="--force-refresh" in sys.argv[1:])
+        # The snapshot is the scraper's only output; surface write failures in the exit code
+        scrape_nam.last_write_future.result()
         # Explicitly signal success so orchestrators don't mis-read an implicit non-zero
         sys.exit(0)
     except SystemExit as se:  # Respect explicit exits
@@ -4,19 +4,46 @@ from __future__ import annotations
 import re
 import time
 import json
-import hashlib
+import atexit
+import sqlite3
+import functools
+import threading
+import sys
 import concurrent.futures
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import pandas as pd
+import requests
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+
+# SPEED: optional vectorized CSV writer (and Parquet copies); falls back to pandas' writer when absent
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    from pyarrow import parquet as pq
+except ImportError:
+    pa = None
+
+# SPEED: optional faster JSON codec for the profile cache
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 # Import backup utility
 try:
@@ -38,9 +65,47 @@ BASE_URL   = (
     "?_member_directory_sort=last_name_asc&_per_page=100"
 )
 WAIT_SEC   = 15
-PAGE_PAUSE = 2.0
 MAX_WORKERS = 5  # Number of parallel scrapers
 CACHE_DIR = Path("cache") / AID  # Directory for caching profile data
+CACHE_DB = CACHE_DIR / "profiles.sqlite"
+CACHE_TTL: Optional[timedelta] = None  # None = cached profiles never expire; --refresh revalidates them
+CACHE_BATCH = 100  # Cache rows per commit
+EMPTY_YEARS_PATH = CACHE_DIR / "empty_years.json"  # Past election years whose listing came back empty
+REQUEST_TIMEOUT = 30  # seconds, per profile page fetch
+MIN_REQUEST_INTERVAL = 0.25  # seconds between HTTP requests to the site, across all worker threads
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+)
+
+# Per-card snapshot columns, in order; the constant id/govid/govname/award columns
+# are prepended when the DataFrame is built (column order is consistent across scrapers)
+CARD_COLUMNS = ["name", "profile_url", "year", "affiliation", "membership_type", "deceased", "death_year"]
+
+# Directory page locators (shared by the Selenium and lxml paths)
+XPATH_CARD = "//div[contains(@class, 'fl-post-grid-post')]"
+XPATH_NEXT = "//a[@class='next page-numbers']"
+MAX_CARDS_PER_YEAR = 1000  # far above any real election class; more means the year filter was ignored
+# SPEED: Chrome has no stylesheet content setting, so Beaver Builder CSS and web fonts are blocked per URL
+BLOCKED_URL_PATTERNS = ["*.css", "*.woff", "*.woff2", "*.ttf", "*.otf"]
+
+# Profile page selectors (static HTML; no JS needed to read them)
+SEL_PROFILE_AFFILIATION = "div[data-node='jd7ypfvaiw1h']"
+SEL_META_ITEM           = "div.meta-item"
+SEL_META_PARAGRAPHS     = "div.fl-rich-text p"
+
+# Precompiled once; these run for every field of every card/profile
+_WS_RE         = re.compile(r"\s+")
+_TAG_RE        = re.compile(r"<[^>]+>")
+_TRAIL_RE      = re.compile(r"[^\w_]+$")
+_YEAR_RE       = re.compile(r"\d{4}")
+_PREFIX_RE     = re.compile(r"^(?:(?:Dr|Mr|Ms|Mrs|Prof)\.?\s+|Professor\s+)+")  # repeatable: "Dr. Prof. X" -> "X"
+_SUFFIX_RE     = re.compile(r"(?:\s+(?:Jr\.?|Sr\.?|II|III|IV)|,\s*(?:PhD|MD|DSc))+$")  # repeatable: "X, MD, PhD" -> "X"
+_DATE_RANGE_RE = re.compile(r"-\s*[A-Za-z]+\s+\d{1,2},\s+(\d{4})")  # "... - December 14, 1873"
+_SECTION_RE    = re.compile(r"^(?:Primary Section|Secondary Section|Section )")
+
+# Card-meta paragraphs that are labels rather than an affiliation (compared lowercased)
+_MEMBERSHIP_LABELS = frozenset({"member", "international member", "emeritus", "public welfare medalist"})
 
 # ----------------------------
 # Helpers
@@ -55,10 +120,7 @@ def new_driver(headless: bool = True) -> webdriver.Chrome:
     opts.add_argument("--disable-gpu")
     opts.add_argument("--no-sandbox")
     opts.add_argument("--disable-dev-shm-usage")
-    opts.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-    )
+    opts.add_argument(f"user-agent={USER_AGENT}")
     # Add options to disable background sync and timer throttling to avoid GCM errors
     opts.add_argument("--disable-background-sync")
     opts.add_argument("--disable-background-timer-throttling")
@@ -67,26 +129,38 @@ def new_driver(headless: bool = True) -> webdriver.Chrome:
     # Suppress browser logging to avoid page load metrics errors
     opts.add_argument("--log-level=3")
     opts.add_argument("--disable-logging")
-    return webdriver.Chrome(options=opts)
+    # SPEED: no extensions, sync or metrics pings in headless runs
+    opts.add_argument("--disable-background-networking")
+    opts.add_argument("--disable-default-apps")
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--disable-sync")
+    opts.add_argument("--metrics-recording-only")
+    opts.add_argument("--no-first-run")
+    opts.add_argument("--mute-audio")
+    # SPEED: the scraper reads text only; skip avatars and notification prompts
+    opts.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    # SPEED: return from driver.get() at DOMContentLoaded; explicit waits gate the cards
+    opts.page_load_strategy = "eager"
+    driver = webdriver.Chrome(options=opts)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except WebDriverException as e:
+        print(f"[{AID}] Resource blocking unavailable: {e}")
+    return driver
 
 def norm_text(s: Optional[str]) -> str:
     """Strip and collapse whitespace; None -> ''."""
     if not s:
         return ""
-    s = s.strip()
-    s = re.sub(r"\s+", " ", s)
-    return s
+    return _WS_RE.sub(" ", s.strip())
 
 def clean_name(name: str) -> str:
-    name = norm_text(name)
-    prefixes = ["Dr. ", "Dr ", "Mr. ", "Mr ", "Ms. ", "Ms ", "Mrs. ", "Mrs ", "Prof. ", "Professor "]
-    suffixes = [" Jr.", " Jr", " Sr.", " Sr", " II", " III", " IV", ", PhD", ", MD", ", DSc"]
-    for p in prefixes:
-        if name.startswith(p):
-            name = name[len(p):]
-    for s in suffixes:
-        if name.endswith(s):
-            name = name[:-len(s)]
+    """Remove common prefixes/suffixes and normalize whitespace."""
+    name = _SUFFIX_RE.sub("", _PREFIX_RE.sub("", norm_text(name)))
     return norm_text(name)
 
 def clean_url(url: str) -> str:
@@ -100,229 +174,477 @@ def clean_key(text: str) -> Optional[str]:
     """Sanitize dynamic label into a safe key name."""
     if not text:
         return None
-    text = re.sub(r"<[^>]+>", "", text).lower().strip()
+    text = _TAG_RE.sub("", text).lower().strip()
     text = text.replace(" ", "_").replace("/", "_")
-    text = re.sub(r"[^\w_]+$", "", text)
+    text = _TRAIL_RE.sub("", text)
     return text or None
 
-# Cache helpers
-def get_cache_path() -> Path:
-    """Create and return cache directory path."""
-    cache_dir = CACHE_DIR
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir
-
-def get_cache_key(url: str) -> str:
-    """Generate a safe filename from URL."""
-    return hashlib.md5(url.encode()).hexdigest() + ".json"
-
-def get_from_cache(url: str) -> Optional[Dict[str, str]]:
-    """Get profile data from cache if available and not older than 2 hours."""
-    cache_path = get_cache_path() / get_cache_key(url)
-    if cache_path.exists():
-        # Check file age
-        mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        if datetime.now() - mtime > timedelta(hours=2):
-            return None
-        try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return None
-    return None
-
-def save_to_cache(url: str, data: Dict[str, str]) -> None:
-    """Save profile data to cache."""
-    cache_path = get_cache_path() / get_cache_key(url)
+def new_session() -> requests.Session:
+    """HTTP session with browser-like headers and retry/backoff on transient errors."""
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=MAX_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Shared pacing for every HTTP request: workers reserve evenly spaced start slots
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+def wait_for_request_slot() -> None:
+    """Block until this thread's slot; keeps requests MIN_REQUEST_INTERVAL apart so parallel workers don't trip 429s."""
+    global _next_request_at
+    with _rate_lock:
+        slot = max(time.monotonic(), _next_request_at)
+        _next_request_at = slot + MIN_REQUEST_INTERVAL
+    delay = slot - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
+@functools.lru_cache(maxsize=None)
+def compile_sel(sel: str) -> CSSSelector:
+    """Compile a CSS selector once; lxml's CSSSelector translates to XPath on construction."""
+    return CSSSelector(sel)
+
+def inner_html(el) -> str:
+    """lxml counterpart of Element.innerHTML."""
+    return (el.text or "") + "".join(etree.tostring(child, encoding="unicode") for child in el)
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write a snapshot CSV with pyarrow when installed (much faster for all-string frames)."""
+    if pa is None:
+        df.to_csv(path, index=False)
+        return
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+
+def write_parquet(df: pd.DataFrame, path: Path) -> None:
+    """Write a zstd-compressed Parquet copy of a snapshot; skipped when pyarrow isn't installed."""
+    if pa is None:
+        return
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), str(path), compression="zstd")
+
+# Cache helpers: one SQLite file instead of one JSON file per profile. The connection is
+# shared by worker threads (serialized by _cache_lock) and writes are committed in batches.
+_cache_db: Optional[sqlite3.Connection] = None
+_cache_lock = threading.Lock()
+_cache_pending: List[Tuple[str, int, bytes, Optional[str], Optional[str]]] = []
+
+def get_cache_db() -> sqlite3.Connection:
+    """Open the profile cache database on first use."""
+    global _cache_db
+    with _cache_lock:
+        if _cache_db is None:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(CACHE_DB), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cache (url TEXT PRIMARY KEY, ts INTEGER NOT NULL, data BLOB NOT NULL,"
+                " etag TEXT, last_modified TEXT)"
+            )
+            # Caches written before revalidation support lack the validator columns
+            columns = {row[1] for row in db.execute("PRAGMA table_info(cache)")}
+            for column in ("etag", "last_modified"):
+                if column not in columns:
+                    db.execute(f"ALTER TABLE cache ADD COLUMN {column} TEXT")
+            _cache_db = db
+        return _cache_db
+
+def get_cache_entry(
+    url: str, max_age: Optional[timedelta] = CACHE_TTL
+) -> Optional[Tuple[Dict[str, str], Optional[str], Optional[str]]]:
+    """Get (data, etag, last_modified) for a cached profile; max_age=None means entries never expire."""
+    db = get_cache_db()
+    cutoff = 0 if max_age is None else int((datetime.now() - max_age).timestamp())
+    with _cache_lock:
+        row = db.execute(
+            "SELECT data, etag, last_modified FROM cache WHERE url = ? AND ts >= ?", (url, cutoff)
+        ).fetchone()
+    if row is None:
+        return None
     try:
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except IOError:
-        pass  # Continue even if cache write fails
+        return json_loads(row[0]), row[1], row[2]
+    except json.JSONDecodeError:
+        return None
+
+def _flush_cache_locked(db: sqlite3.Connection) -> None:
+    """Commit queued cache rows in one transaction; caller holds _cache_lock."""
+    if not _cache_pending:
+        return
+    try:
+        with db:
+            db.executemany(
+                "INSERT OR REPLACE INTO cache (url, ts, data, etag, last_modified) VALUES (?, ?, ?, ?, ?)",
+                _cache_pending,
+            )
+    except sqlite3.Error as e:
+        print(f"[{AID}] Warning: cache write failed: {e}")  # Continue even if cache write fails
+    _cache_pending.clear()
+
+def save_to_cache(
+    url: str, data: Dict[str, str], etag: Optional[str] = None, last_modified: Optional[str] = None
+) -> None:
+    """Queue profile data (plus its HTTP validators) for the cache; rows are committed every CACHE_BATCH saves."""
+    db = get_cache_db()
+    row = (url, int(datetime.now().timestamp()), json_dumps(data), etag, last_modified)
+    with _cache_lock:
+        _cache_pending.append(row)
+        if len(_cache_pending) >= CACHE_BATCH:
+            _flush_cache_locked(db)
+
+def close_cache() -> None:
+    """Commit any queued rows and close the database (registered with atexit)."""
+    global _cache_db
+    with _cache_lock:
+        if _cache_db is None:
+            return
+        _flush_cache_locked(_cache_db)
+        _cache_db.close()
+        _cache_db = None
+
+atexit.register(close_cache)
+
+def load_empty_years() -> Set[int]:
+    """Past election years already known to have no members (skipped on later runs)."""
+    try:
+        return set(json.loads(EMPTY_YEARS_PATH.read_text(encoding="utf-8")))
+    except (OSError, ValueError, TypeError):
+        return set()
+
+def save_empty_years(years: Set[int]) -> None:
+    """Persist the known-empty years sidecar next to the profile cache."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        EMPTY_YEARS_PATH.write_text(json.dumps(sorted(years)), encoding="utf-8")
+    except OSError as e:
+        print(f"[{AID}] Warning: could not save {EMPTY_YEARS_PATH}: {e}")
 
 # ----------------------------
 # Core scraper
 # ----------------------------
-def extract_card_info(card) -> Dict[str, str]:
-    """Extract basic information from a member card on the directory page."""
-    try:
-        # Extract profile link
-        link_element = card.find_element(By.XPATH, ".//h5/a")
-        profile_url = clean_url(link_element.get_attribute("href") or "")
-        
-        # Extract name from link text
-        name_text = norm_text(link_element.text)
-        
-        # Extract membership type and living/deceased status from CSS classes
-        card_classes = card.get_attribute("class") or ""
-        
-        # Parse membership type from classes
-        membership_type = ""
-        if "membership-type-member" in card_classes:
-            membership_type = "member"
-        elif "membership-type-international-member" in card_classes:
-            membership_type = "international-member"
-        elif "membership-type-emeritus" in card_classes:
-            membership_type = "emeritus"
-        elif "membership-type-public-welfare-medalist" in card_classes:
-            membership_type = "public-welfare-medalist"
-        
-        # Parse living/deceased status from classes
+def card_record(href: str, link_text: str, card_classes: str, meta_texts: Iterable[str]) -> Dict[str, str]:
+    """
+    Build a card dict from one directory card's raw fields; shared by the Selenium and HTTP paths.
+    meta_texts may be lazy: it is consumed only up to the affiliation paragraph.
+    """
+    profile_url = clean_url(href or "")
+
+    # Extract name from link text
+    name_text = norm_text(link_text)
+
+    # Parse membership type from classes
+    membership_type = ""
+    if "membership-type-member" in card_classes:
+        membership_type = "member"
+    elif "membership-type-international-member" in card_classes:
+        membership_type = "international-member"
+    elif "membership-type-emeritus" in card_classes:
+        membership_type = "emeritus"
+    elif "membership-type-public-welfare-medalist" in card_classes:
+        membership_type = "public-welfare-medalist"
+
+    # Parse living/deceased status from classes
+    deceased_status = ""
+    if "living-deceased-deceased" in card_classes:
+        deceased_status = "Y"
+    elif "living-deceased-living" in card_classes:
         deceased_status = ""
-        if "living-deceased-deceased" in card_classes:
-            deceased_status = "Y"
-        elif "living-deceased-living" in card_classes:
-            deceased_status = ""
-        
-        # Extract affiliation from card-meta section
-        affiliation = ""
-        death_year = ""
-        try:
-            card_meta = card.find_element(By.CSS_SELECTOR, ".card-meta")
-            meta_paragraphs = card_meta.find_elements(By.TAG_NAME, "p")
+
+    # Extract affiliation from card-meta section
+    affiliation = ""
+    death_year = ""
+    # Look for affiliation - skip membership type and section labels
+    for raw_text in meta_texts:
+        p_text = norm_text(raw_text)
+        if p_text and p_text.lower() not in _MEMBERSHIP_LABELS and not _SECTION_RE.match(p_text):
             
-            # Look for affiliation - skip membership type and section labels
-            membership_labels = ["member", "international member", "emeritus", "public welfare medalist"]
-            for p in meta_paragraphs:
-                p_text = norm_text(p.text)
-                p_lower = p_text.lower()
-                if (p_text and 
-                    p_lower not in membership_labels and
-                    not p_text.startswith("Primary Section") and 
-                    not p_text.startswith("Secondary Section") and
-                    not p_text.startswith("Section ")):
-                    
-                    # Check if this "affiliation" is actually a date range (e.g. for deceased members)
-                    # Example: "May 28, 1807 - December 14, 1873"
-                    # Regex to find a year at the end of the string
-                    date_match = re.search(r'-\s*[A-Za-z]+\s+\d{1,2},\s+(\d{4})', p_text)
-                    if date_match:
-                        death_year = date_match.group(1)
-                        # If it's a date range, it's not an affiliation
-                        affiliation = "" 
-                    else:
-                        affiliation = p_text
-                    break
-        except NoSuchElementException:
-            affiliation = ""
-        
-        return {
-            "profile_url": profile_url,
-            "name": clean_name(name_text),
-            "membership_type": membership_type,
-            "deceased": deceased_status,
-            "affiliation": affiliation,
-            "death_year": death_year,
-        }
-    except Exception as e:
-        print(f"[{AID}] Error extracting card info: {e}")
+            # Check if this "affiliation" is actually a date range (e.g. for deceased members)
+            # Example: "May 28, 1807 - December 14, 1873"
+            # Regex to find a year at the end of the string
+            date_match = _DATE_RANGE_RE.search(p_text)
+            if date_match:
+                death_year = date_match.group(1)
+                # If it's a date range, it's not an affiliation
+                affiliation = "" 
+            else:
+                affiliation = p_text
+            break
+
+    return {
+        "profile_url": profile_url,
+        "name": clean_name(name_text),
+        "membership_type": membership_type,
+        "deceased": deceased_status,
+        "affiliation": affiliation,
+        "death_year": death_year,
+    }
+
+# SPEED: read every card on the page in one execute_script round-trip instead of
+# ~5 find_element/get_attribute/.text commands per card. Called with XPATH_CARD;
+# innerText matches WebElement.text semantics.
+_JS_EXTRACT_CARDS = """
+const [cardXPath] = arguments;
+const snap = document.evaluate(cardXPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = [];
+for (let i = 0; i < snap.snapshotLength; i++) {
+    const card = snap.snapshotItem(i);
+    const link = card.querySelector("h5 > a");
+    if (!link) continue;
+    const meta = card.querySelector(".card-meta");
+    out.push({
+        href:    link.href || "",
+        text:    link.innerText || "",
+        classes: card.className || "",
+        meta:    meta ? Array.from(meta.querySelectorAll("p"), (p) => p.innerText || "") : [],
+    });
+}
+return JSON.stringify(out);
+"""
+
+def extract_page_cards(driver: webdriver.Chrome) -> List[Dict[str, str]]:
+    """Extract basic information from every member card on the current directory page."""
+    raw_cards = json_loads(driver.execute_script(_JS_EXTRACT_CARDS, XPATH_CARD))
+    return [card_record(c["href"], c["text"], c["classes"], c["meta"]) for c in raw_cards]
+
+def card_from_html(card) -> Dict[str, str]:
+    """lxml counterpart of _JS_EXTRACT_CARDS for one server-rendered card."""
+    links = card.xpath(".//h5/a")
+    if not links:
         return {}
+    card_meta = compile_sel(".card-meta")(card)
+    meta_texts = (p.text_content() for p in card_meta[0].iter("p")) if card_meta else ()
+    return card_record(links[0].get("href") or "", links[0].text_content(), card.get("class") or "", meta_texts)
+
+def parse_directory_html(html: str, page_url: str) -> Tuple[List[Dict[str, str]], Optional[str]]:
+    """Parse one server-rendered directory page into (cards, absolute URL of the next page or None)."""
+    doc = lxml.html.fromstring(html)
+    doc.make_links_absolute(page_url)
+    cards = [info for info in map(card_from_html, doc.xpath(XPATH_CARD)) if info]
+    next_links = doc.xpath(XPATH_NEXT)
+    return cards, (next_links[0].get("href") if next_links else None)
+
+def fetch_directory_http(
+    session: requests.Session,
+    url: str,
+    processed_urls: Set[str],
+    year: Optional[int] = None,
+    max_cards: Optional[int] = None,
+) -> List[Dict[str, str]]:
+    """
+    Follow one directory listing's "next" links over plain HTTP, collecting cards not seen before.
+    With max_cards, stops following pages once more than max_cards cards have been collected.
+    """
+    cards_info: List[Dict[str, str]] = []
+    visited: Set[str] = set()
+    next_url: Optional[str] = url
+    while next_url and next_url not in visited:
+        if max_cards is not None and len(cards_info) > max_cards:
+            break
+        visited.add(next_url)
+        wait_for_request_slot()
+        resp = session.get(next_url, timeout=REQUEST_TIMEOUT)
+        resp.raise_for_status()
+        cards, next_url = parse_directory_html(resp.text, resp.url)
+        for card_info in cards:
+            url_key = card_info.get("profile_url")
+            if url_key and url_key not in processed_urls:
+                if year is not None:
+                    card_info["year"] = str(year)  # Add the election year from URL parameter
+                cards_info.append(card_info)
+                processed_urls.add(url_key)
+    return cards_info
+
+def member_base(link: str) -> Dict[str, str]:
+    """Constant and default fields of a profile row, before the card and profile fields are merged in."""
+    return {
+        "id": AID,
+        "govid": GOVID,
+        "govname": GOVNAME,
+        "award": AWARD,
+        "year": "",
+        "affiliation": "",
+        "death_year": "",
+        "profile_url": link,  # PRIMARY KEY
+    }
+
+def scrape_profile_details(
+    session: requests.Session, link: str, base_info: Dict[str, str], refresh: bool = False
+) -> Dict[str, str]:
+    """
+    Scrape detailed information from a member profile page.
+    SPEED: profile pages are static HTML, so they're fetched over plain HTTP and parsed
+    with lxml (no browser); the session is safe to share across worker threads.
+    Only the fields parsed from the profile page are cached; they are merged over the current
+    card on every hit, so directory-card changes always reach the snapshot.
+    With refresh, cached profiles are revalidated with a conditional GET instead of reused as-is.
+    """
+    # Include info from card
+    member: Dict[str, str] = {**member_base(link), **base_info}
 
-def scrape_profile_details(link: str, base_info: Dict[str, str]) -> Dict[str, str]:
-    """Scrape detailed information from a member profile page."""
     # Check cache first
-    cached_data = get_from_cache(link)
-    if cached_data:
+    cached = get_cache_entry(link)
+    if cached and "profile_url" in cached[0]:
+        cached = None  # Rows cached before profile-only caching hold a stale copy of the whole card
+    if cached and not refresh:
         print(f"[{AID}] Using cached data for: {link}")
-        return cached_data
+        return {**member, **cached[0]}
+
+    # SPEED: revalidate with the stored validators so unchanged profiles come back as bodiless 304s
+    headers: Dict[str, str] = {}
+    if cached:
+        cached_data, etag, last_modified = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
 
-    # Create a new driver for each thread to avoid concurrency issues
-    driver = new_driver(headless=True)
     try:
-        driver.set_page_load_timeout(30)
-        
-        member: Dict[str, str] = {
-            "id": AID,
-            "govid": GOVID,
-            "govname": GOVNAME,
-            "award": AWARD,
-            "year": "",
-            "affiliation": "",
-            "death_year": "",
-            "profile_url": link,  # PRIMARY KEY
-            **base_info  # Include info from card
-        }
-
-        driver.get(link)
+        profile: Dict[str, str] = {}  # Fields parsed from the profile page (what gets cached)
+
+        wait_for_request_slot()
+        resp = session.get(link, headers=headers, timeout=REQUEST_TIMEOUT)
+        if resp.status_code == 304 and cached:
+            save_to_cache(link, cached_data, etag, last_modified)  # Still current; just bump its timestamp
+            return {**member, **cached_data}
+        resp.raise_for_status()
+        doc = lxml.html.fromstring(resp.text)
 
         # Get affiliation - this is the main missing piece from cards
-        try:
-            aff_div = driver.find_element(By.CSS_SELECTOR, "div[data-node='jd7ypfvaiw1h']")
-            paragraphs = aff_div.find_elements(By.TAG_NAME, "p")
-            aff_text = "\n".join([norm_text(p.text) for p in paragraphs if norm_text(p.text)])
-            member["affiliation"] = aff_text
-        except NoSuchElementException:
-            member["affiliation"] = ""
+        # (kept from the card when the profile has no affiliation block)
+        aff_div = compile_sel(SEL_PROFILE_AFFILIATION)(doc)
+        if aff_div:
+            paragraphs = (norm_text(p.text_content()) for p in compile_sel("p")(aff_div[0]))
+            # Joined with spaces: the old final normalization pass collapsed the newlines anyway
+            profile["affiliation"] = " ".join(t for t in paragraphs if t)
 
         # Dynamic meta items - get election year and other details
-        try:
-            meta_items = driver.find_elements(By.CSS_SELECTOR, "div.meta-item")
-            for item in meta_items:
-                try:
-                    p_elems = item.find_elements(By.CSS_SELECTOR, "div.fl-rich-text p")
-                    if len(p_elems) >= 2:
-                        label_html = (p_elems[0].get_attribute("innerHTML") or "").strip()
-                        value = norm_text(p_elems[1].text)
-                        key = clean_key(label_html)
-                        if key and value is not None:
-                            if key == "election_year":
-                                member["year"] = value
-                            elif key == "birth___deceased_date":
-                                parts = value.split("-")
-                                if len(parts) > 1 and norm_text(parts[1]):
-                                    member["deceased"] = "Y"
-                                    try:
-                                        d_match = re.search(r'\d{4}', parts[1])
-                                        if d_match:
-                                            member["death_year"] = d_match.group(0)
-                                    except Exception:
-                                        pass
+        for item in compile_sel(SEL_META_ITEM)(doc):
+            try:
+                p_elems = compile_sel(SEL_META_PARAGRAPHS)(item)
+                if len(p_elems) >= 2:
+                    label_html = inner_html(p_elems[0]).strip()
+                    value = norm_text(p_elems[1].text_content())
+                    key = clean_key(label_html)
+                    if key and value is not None:
+                        if key == "election_year":
+                            profile["year"] = value
+                        elif key == "birth___deceased_date":
+                            parts = value.split("-")
+                            if len(parts) > 1 and norm_text(parts[1]):
+                                profile["deceased"] = "Y"
+                                try:
+                                    d_match = _YEAR_RE.search(parts[1])
+                                    if d_match:
+                                        profile["death_year"] = d_match.group(0)
+                                except Exception:
+                                    pass
+                        else:
+                            # Write dynamic fields if they don't collide
+                            if key not in member and key not in profile:
+                                profile[key] = value
                             else:
-                                # Write dynamic fields if they don't collide
-                                if key not in member:
-                                    member[key] = value
-                                else:
-                                    member[f"dynamic_{key}"] = value
-                except Exception:
-                    continue
-        except NoSuchElementException:
-            pass
+                                profile[f"dynamic_{key}"] = value
+            except Exception:
+                continue
 
-        # Normalize fields
-        for k in list(member.keys()):
-            member[k] = clean_name(member[k]) if k == "name" else norm_text(member[k])
+        # SPEED: no final normalization pass. Card fields come from card_record() and every
+        # profile value above went through norm_text() when it was extracted.
 
         # Cache successful results
-        save_to_cache(link, member)
-        return member
+        save_to_cache(link, profile, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+        return {**member, **profile}
 
-    except TimeoutException:
+    except requests.Timeout:
         print(f"[{AID}] Timed out loading profile page: {link}")
-        return {"profile_url": link, "error": "timeout", **base_info}
+        return base_info  # Keep the card as is; no transient error column in the snapshot
     except Exception as e:
         print(f"[{AID}] Error processing profile {link}: {e}")
-        return {"profile_url": link, "error": str(e), **base_info}
+        return base_info
+
+def collect_cards_http(start_year: int, current_year: int, refresh: bool = False) -> Optional[List[Dict[str, str]]]:
+    """
+    SPEED: collect directory cards year by year over plain HTTP, parsing with lxml (no browser).
+    Past years recorded as empty are skipped unless refresh is set.
+    Returns None when this path can't be trusted, so the caller falls back to Selenium.
+    """
+    session = new_session()
+    all_cards_info: List[Dict[str, str]] = []
+    processed_urls: Set[str] = set()
+    empty_years = set() if refresh else load_empty_years()
+    years = [y for y in range(start_year, current_year + 1) if y not in empty_years]
+    try:
+        def fetch_year(year: int) -> List[Dict[str, str]]:
+            # Capped: an over-large listing stops paging as soon as it proves the filter was ignored
+            url = f"{BASE_URL}&_election_year={year}"
+            return fetch_directory_http(session, url, set(), year, max_cards=MAX_CARDS_PER_YEAR)
+
+        # Probe one year serially first, so an ignored year filter is caught before every year is fetched
+        per_year = [fetch_year(years[0])] if years else []
+        if per_year and len(per_year[0]) <= MAX_CARDS_PER_YEAR:
+            # SPEED: years are independent listings, so fetch them MAX_WORKERS at a time (each with
+            # its own seen-set), then merge in year order so the earliest year still wins a duplicate
+            with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                per_year.extend(pool.map(fetch_year, years[1:]))
+
+        for year, year_cards in zip(years, per_year):
+            if len(year_cards) > MAX_CARDS_PER_YEAR:
+                # The whole directory came back: the server ignored the year filter
+                print(f"[{AID}] HTTP: year filter not honored ({len(year_cards)} cards for {year}); falling back to Selenium")
+                return None
+            if not year_cards and year < current_year:
+                empty_years.add(year)  # The current year's class may still be posted
+            cards_from_year = [card for card in year_cards if card["profile_url"] not in processed_urls]
+            processed_urls.update(card["profile_url"] for card in cards_from_year)
+            if cards_from_year:
+                print(f"[{AID}] Year {year}: found {len(cards_from_year)} new members")
+            all_cards_info.extend(cards_from_year)
+
+        print(f"\n[{AID}] Year-based scraping collected {len(all_cards_info)} profiles")
+
+        # If year filtering didn't work well, try without year filter as fallback
+        if len(all_cards_info) < 1000:
+            print(f"[{AID}] Year-based scraping yielded only {len(all_cards_info)} results, trying full directory scan...")
+            fallback_cards = fetch_directory_http(session, BASE_URL, set())
+            empty_years = set()  # The year listings looked wrong; don't record any as empty
+            if len(fallback_cards) > len(all_cards_info):
+                print(f"[{AID}] Using fallback results: {len(fallback_cards)} profiles")
+                all_cards_info = fallback_cards
+    except (requests.RequestException, etree.ParserError) as e:
+        print(f"[{AID}] HTTP: fetch failed ({e}); falling back to Selenium")
+        return None
     finally:
-        driver.quit()
+        session.close()
+
+    if not all_cards_info:
+        print(f"[{AID}] HTTP: no server-rendered cards; falling back to Selenium")
+        return None
+    # Only a run whose year listings parsed is trusted to say which years are empty
+    if empty_years:
+        save_empty_years(empty_years)
+    return all_cards_info
 
-def scrape_nas() -> pd.DataFrame:
+def collect_cards_selenium(start_year: int, current_year: int, refresh: bool = False) -> List[Dict[str, str]]:
     """
-    Scrape NAS directory by iterating through election years to capture year information.
+    Collect directory cards year by year in headless Chrome, clicking through pagination.
+    Years recorded as empty by the HTTP path are skipped unless refresh is set.
     """
+    # No implicit wait: misses on optional card elements are normal and must fail fast;
+    # readiness is gated by explicit WebDriverWaits instead
     driver = new_driver(headless=True)
-    driver.implicitly_wait(5)
+    # SPEED: eager loads return at DOMContentLoaded; cap a stalled get() instead of Chrome's 300 s default
+    # (load_page retries and reports the timeout, so it never reads as an empty year)
+    driver.set_page_load_timeout(WAIT_SEC)
     
     all_cards_info: List[Dict[str, str]] = []
     processed_urls: Set[str] = set()
-    
-    # Define year ranges to iterate through - NAS started in 1863
-    current_year = datetime.now().year
-    start_year = 1863
-    
-    print(f"[{AID}] Starting card collection by iterating through years {start_year}-{current_year}")
+    empty_years = set() if refresh else load_empty_years()
     
     # Iterate through individual years to get election year data
     for year in range(start_year, current_year + 1):
+        if year in empty_years:
+            continue
         # Use the correct parameter name: _election_year
         year_url = f"{BASE_URL}&_election_year={year}"
         cards_from_year = scrape_year_cards(driver, year, year_url, processed_urls)
@@ -347,18 +669,60 @@ def scrape_nas() -> pd.DataFrame:
             print(f"[{AID}] Keeping year-based results: {len(all_cards_info)} profiles")
 
     driver.quit()
+    return all_cards_info
+
+def fetch_profiles(cards: List[Dict[str, str]], refresh: bool = False) -> List[Dict[str, str]]:
+    """
+    Enrich directory cards with their profile-page details, MAX_WORKERS pages in flight at a time.
+    Results keep the input order; a profile that fails keeps its card data.
+    With refresh, cached profiles are revalidated against the site.
+    """
+    print(f"[{AID}] Fetching {len(cards)} profile pages with {MAX_WORKERS} workers...")
+    session = new_session()
+    results: List[Dict[str, str]] = list(cards)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = {
+                pool.submit(scrape_profile_details, session, card["profile_url"], card, refresh): i
+                for i, card in enumerate(cards)
+            }
+            for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:  # One bad profile must not sink the batch
+                    print(f"[{AID}] Error processing profile {cards[i]['profile_url']}: {e}")
+                if done % 500 == 0:
+                    print(f"[{AID}] Profiles: {done}/{len(cards)} done")
+    finally:
+        session.close()
+    return results
+
+def scrape_nas(fetch_profile_details: bool = False, refresh: bool = False) -> pd.DataFrame:
+    """
+    Scrape NAS directory by iterating through election years to capture year information.
+    Tries plain HTTP first and falls back to Selenium. With fetch_profile_details, every
+    member's profile page is also fetched (in parallel) to add its election year,
+    full affiliation and meta fields. Known-empty years and cached profiles are reused
+    unless refresh is set.
+    """
+    # Define year ranges to iterate through - NAS started in 1863
+    current_year = datetime.now().year
+    start_year = 1863
+    
+    print(f"[{AID}] Starting card collection by iterating through years {start_year}-{current_year}")
+
+    all_cards_info = collect_cards_http(start_year, current_year, refresh=refresh)
+    if all_cards_info is None:
+        all_cards_info = collect_cards_selenium(start_year, current_year, refresh=refresh)
     
     print(f"\n[{AID}] Total unique profiles collected: {len(all_cards_info)}")
     
     if len(all_cards_info) < 5000:
         print(f"[{AID}] WARNING: Only collected {len(all_cards_info)} profiles, expected around 7000.")
 
-    # Add standard metadata fields to all cards
-    for card_info in all_cards_info:
-        card_info.setdefault("id", AID)
-        card_info.setdefault("govid", GOVID)
-        card_info.setdefault("govname", GOVNAME)
-        card_info.setdefault("award", AWARD)
+    if fetch_profile_details:
+        all_cards_info = fetch_profiles(all_cards_info, refresh=refresh)
 
     # ----------------------------
     # Persist: timestamped snapshot + optional flat CSV
@@ -367,30 +731,27 @@ def scrape_nas() -> pd.DataFrame:
     snap_dir.mkdir(parents=True, exist_ok=True)
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     snap_path = snap_dir / f"{stamp}.csv"
-    df = pd.DataFrame(all_cards_info, dtype=str).fillna("")
-    
-    # Reorder columns for consistency across scrapers
-    desired_order = [
-        "id", "govid", "govname", "award", 
-        "name", "profile_url", "year", 
-        "affiliation", "location", "membership_type", 
-        "deceased", "death_year"
-    ]
-    # Filter to only columns that actually exist
-    existing_cols = df.columns.tolist()
-    final_cols = [c for c in desired_order if c in existing_cols]
-    # Append any extra columns not in the desired list
-    remaining_cols = [c for c in existing_cols if c not in final_cols]
-    df = df[final_cols + remaining_cols]
-
-    df.to_csv(snap_path, index=False)
+
+    # SPEED: build column-wise against a fixed schema (no per-row dict transposition,
+    # dtype inference or fillna), then broadcast the constant metadata columns up front
+    meta_cols = [("id", AID), ("govid", GOVID), ("govname", GOVNAME), ("award", AWARD)]
+    # Profile pages contribute dynamic fields; append any extra columns after the fixed ones
+    known = set(CARD_COLUMNS).union(col for col, _ in meta_cols)
+    extra_cols = sorted({k for card in all_cards_info for k in card} - known)
+    df = pd.DataFrame({col: [card.get(col, "") for card in all_cards_info] for col in CARD_COLUMNS + extra_cols})
+    for pos, (col, value) in enumerate(meta_cols):
+        df.insert(pos, col, value)
+
+    write_csv(df, snap_path)
+    # Compact columnar copy next to the CSV; diffing keeps reading the CSV snapshots
+    write_parquet(df, snap_path.with_suffix(".parquet"))
 
     # Save to secondary backup location (if configured)
     save_backup_snapshot(snap_path, AID)
 
     # Also write your legacy flat CSV if `filepath` exists in runtime
     try:
-        df.to_csv(f"{filepath}{AID}.csv", index=False)  # type: ignore[name-defined]
+        write_csv(df, Path(f"{filepath}{AID}.csv"))  # type: ignore[name-defined]
     except NameError:
         pass
 
@@ -402,19 +763,34 @@ def scrape_nas() -> pd.DataFrame:
 
     return df
 
+def load_page(driver: webdriver.Chrome, url: str, attempts: int = 3) -> bool:
+    """
+    driver.get() with retries on the page-load timeout. Kept apart from the card waits so a slow
+    load is reported as a failure instead of being mistaken for an empty listing.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            driver.get(url)
+            return True
+        except TimeoutException:
+            print(f"[{AID}] Page load timed out ({attempt}/{attempts}): {url}")
+    return False
+
 def scrape_year_cards(driver: webdriver.Chrome, year: int, url: str, processed_urls: Set[str]) -> List[Dict[str, str]]:
     """Scrape all cards for a specific election year."""
     cards_info: List[Dict[str, str]] = []
     
     try:
-        driver.get(url)
+        if not load_page(driver, url):
+            print(f"[{AID}] WARNING: could not load year {year}; its members are missing from this run")
+            return cards_info
         # Wait for cards to load
         WebDriverWait(driver, WAIT_SEC).until(
-            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'fl-post-grid-post')]"))
+            EC.presence_of_element_located((By.XPATH, XPATH_CARD))
         )
         
         # Check if there are any results for this year
-        member_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'fl-post-grid-post')]")
+        member_cards = driver.find_elements(By.XPATH, XPATH_CARD)
         
         if not member_cards:
             return cards_info
@@ -425,32 +801,27 @@ def scrape_year_cards(driver: webdriver.Chrome, year: int, url: str, processed_u
         
         while True:
             # Process current page
-            for card in member_cards:
-                try:
-                    card_info = extract_card_info(card)
-                    if card_info and card_info.get("profile_url"):
-                        url_key = card_info["profile_url"]
-                        if url_key not in processed_urls:
-                            card_info["year"] = str(year)  # Add the election year from URL parameter
-                            cards_info.append(card_info)
-                            processed_urls.add(url_key)
-                            cards_found += 1
-                except Exception:
-                    continue
+            for card_info in extract_page_cards(driver):
+                url_key = card_info["profile_url"]
+                if url_key and url_key not in processed_urls:
+                    card_info["year"] = str(year)  # Add the election year from URL parameter
+                    cards_info.append(card_info)
+                    processed_urls.add(url_key)
+                    cards_found += 1
             
             # Check for next page within this year's results
             try:
-                next_button = driver.find_element(By.XPATH, "//a[@class='next page-numbers']")
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                time.sleep(0.5)
+                next_button = driver.find_element(By.XPATH, XPATH_NEXT)
+                # A JS click needs no scrolling; the old first card going stale marks the page turn
+                old_first_card = member_cards[0]
                 driver.execute_script("arguments[0].click();", next_button)
-                time.sleep(PAGE_PAUSE)
-                
+                WebDriverWait(driver, 10).until(EC.staleness_of(old_first_card))
+
                 # Wait for new page to load
                 WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'fl-post-grid-post')]"))
+                    EC.presence_of_element_located((By.XPATH, XPATH_CARD))
                 )
-                member_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'fl-post-grid-post')]")
+                member_cards = driver.find_elements(By.XPATH, XPATH_CARD)
                 page_num += 1
                 
             except (NoSuchElementException, TimeoutException):
@@ -472,9 +843,11 @@ def scrape_year_cards(driver: webdriver.Chrome, year: int, url: str, processed_u
 def scrape_all_pages(driver: webdriver.Chrome, processed_urls: Set[str]) -> List[Dict[str, str]]:
     """Fallback: scrape all pages without year filtering."""
     try:
-        driver.get(BASE_URL)
+        if not load_page(driver, BASE_URL):
+            print(f"[{AID}] WARNING: could not load the directory")
+            return []
         WebDriverWait(driver, WAIT_SEC).until(
-            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'fl-post-grid-post')]"))
+            EC.presence_of_element_located((By.XPATH, XPATH_CARD))
         )
         print(f"[{AID}] Accessed: {BASE_URL}")
     except Exception as e:
@@ -493,7 +866,7 @@ def scrape_all_pages(driver: webdriver.Chrome, processed_urls: Set[str]) -> List
         
         try:
             member_cards = WebDriverWait(driver, WAIT_SEC).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//div[contains(@class, 'fl-post-grid-post')]"))
+                EC.presence_of_all_elements_located((By.XPATH, XPATH_CARD))
             )
             num_cards = len(member_cards)
             print(f"[{AID}] Page {current_page}: found {num_cards} cards on page")
@@ -501,19 +874,16 @@ def scrape_all_pages(driver: webdriver.Chrome, processed_urls: Set[str]) -> List
             cards_found_on_page = 0
             skipped_on_page = 0
             
-            for i, card in enumerate(member_cards):
-                try:
-                    card_info = extract_card_info(card)
-                    if card_info and card_info.get("profile_url"):
-                        url = card_info["profile_url"]
-                        if url not in processed_urls:
-                            cards_info.append(card_info)
-                            processed_urls.add(url)
-                            cards_found_on_page += 1
-                        else:
-                            skipped_on_page += 1
-                except Exception:
+            for card_info in extract_page_cards(driver):
+                url = card_info["profile_url"]
+                if not url:
                     continue
+                if url not in processed_urls:
+                    cards_info.append(card_info)
+                    processed_urls.add(url)
+                    cards_found_on_page += 1
+                else:
+                    skipped_on_page += 1
             
             page_time = time.time() - page_start_time
             print(f"[{AID}] Page {current_page}: processed {num_cards} cards in {page_time:.1f}s")
@@ -530,7 +900,7 @@ def scrape_all_pages(driver: webdriver.Chrome, processed_urls: Set[str]) -> List
             next_button = None
             try:
                 next_button = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//a[@class='next page-numbers']"))
+                    EC.element_to_be_clickable((By.XPATH, XPATH_NEXT))
                 )
             except (NoSuchElementException, TimeoutException):
                 try:
@@ -540,13 +910,13 @@ def scrape_all_pages(driver: webdriver.Chrome, processed_urls: Set[str]) -> List
 
             if next_button:
                 try:
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                    time.sleep(1)
+                    # A JS click needs no scrolling; the old first card going stale marks the page turn
+                    old_first_card = member_cards[0]
                     driver.execute_script("arguments[0].click();", next_button)
-                    time.sleep(PAGE_PAUSE)
-                    
+                    WebDriverWait(driver, 10).until(EC.staleness_of(old_first_card))
+
                     WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'fl-post-grid-post')]"))
+                        EC.presence_of_element_located((By.XPATH, XPATH_CARD))
                     )
                     current_page += 1
                     print(f"[{AID}]   Navigated to page {current_page}")
@@ -564,4 +934,9 @@ def scrape_all_pages(driver: webdriver.Chrome, processed_urls: Set[str]) -> List
 
 # Allow running as a module: python -m scrapers.nas
 if __name__ == "__main__":
-    df = scrape_nas()
+    # --profiles: also fetch every member's profile page (thousands of extra requests)
+    # --refresh: re-check known-empty years and revalidate cached profile pages
+    df = scrape_nas(
+        fetch_profile_details="--profiles" in sys.argv[1:],
+        refresh="--refresh" in sys.argv[1:],
+    )